@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class EfficientFrontierConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'efficient_frontier'
+
+    def ready(self):
+        import efficient_frontier.signals  # noqa: F401  (registers signal handlers)
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EquityPrice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('open_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('high_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('low_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('close_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('volume', models.BigIntegerField()),
+            ],
+            options={
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Ticker',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticker', models.CharField(max_length=10, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('market', models.CharField(blank=True, max_length=50, null=True)),
+                ('sic_code', models.CharField(blank=True, max_length=10, null=True)),
+                ('sic_description', models.CharField(blank=True, max_length=255, null=True)),
+                ('address', models.CharField(blank=True, max_length=255, null=True)),
+                ('city', models.CharField(blank=True, max_length=100, null=True)),
+                ('currency_name', models.CharField(blank=True, max_length=20, null=True)),
+                ('last_updated', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.DeleteModel(
+            name='Company',
+        ),
+        migrations.AddIndex(
+            model_name='ticker',
+            index=models.Index(fields=['ticker'], name='efficient_f_ticker_1aa164_idx'),
+        ),
+        migrations.AddField(
+            model_name='equityprice',
+            name='ticker',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='efficient_frontier.ticker'),
+        ),
+        migrations.AddIndex(
+            model_name='equityprice',
+            index=models.Index(fields=['date'], name='efficient_f_date_42f0a3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='equityprice',
+            index=models.Index(fields=['ticker', 'date'], name='efficient_f_ticker__d69dd8_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='equityprice',
+            unique_together={('ticker', 'date')},
+        ),
+    ]
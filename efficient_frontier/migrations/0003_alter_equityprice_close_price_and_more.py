@@ -0,0 +1,33 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0002_equityprice_ticker_delete_company_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='equityprice',
+            name='close_price',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='equityprice',
+            name='high_price',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='equityprice',
+            name='low_price',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='equityprice',
+            name='open_price',
+            field=models.FloatField(),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0003_alter_equityprice_close_price_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='equityprice',
+            index=models.Index(fields=['ticker', 'date'], include=('close_price',), name='ep_tk_dt_cp_covering'),
+        ),
+    ]
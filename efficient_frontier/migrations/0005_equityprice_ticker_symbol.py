@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:43
+
+from django.db import migrations, models
+
+
+def backfill_ticker_symbol(apps, schema_editor):
+    EquityPrice = apps.get_model('efficient_frontier', 'EquityPrice')
+    Ticker = apps.get_model('efficient_frontier', 'Ticker')
+    EquityPrice.objects.update(
+        ticker_symbol=models.Subquery(
+            Ticker.objects.filter(pk=models.OuterRef('ticker_id')).values('ticker')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0004_equityprice_ep_tk_dt_cp_covering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='equityprice',
+            name='ticker_symbol',
+            field=models.CharField(db_index=True, default='', max_length=10),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_ticker_symbol, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0005_equityprice_ticker_symbol'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='equityprice',
+            name='ticker',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='prices', to='efficient_frontier.ticker'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:44
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0006_alter_equityprice_ticker'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='equityprice',
+            options={},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-15 11:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0007_alter_equityprice_options'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='equityprice',
+            name='efficient_f_date_42f0a3_idx',
+        ),
+    ]
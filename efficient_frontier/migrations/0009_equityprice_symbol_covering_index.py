@@ -0,0 +1,30 @@
+# Generated by Django 5.1.5 on 2026-10-15 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('efficient_frontier', '0008_remove_equityprice_efficient_f_date_42f0a3_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='equityprice',
+            name='efficient_f_ticker__d69dd8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='equityprice',
+            name='ep_tk_dt_cp_covering',
+        ),
+        migrations.AlterField(
+            model_name='equityprice',
+            name='ticker_symbol',
+            field=models.CharField(max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='equityprice',
+            index=models.Index(fields=['ticker_symbol', 'date'], include=('close_price',), name='ep_sym_dt_cp_covering'),
+        ),
+    ]
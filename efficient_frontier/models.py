@@ -81,22 +81,26 @@ class EquityPrice(models.Model):
 
     Fields:
     -------
-    ticker : ForeignKey (Ticker, on_delete=models.CASCADE)
-        A foreign key linking the price entry to the corresponding Ticker.
+    ticker : ForeignKey (Ticker, on_delete=models.CASCADE, related_name="prices")
+        A foreign key linking the price entry to the corresponding Ticker. Reverse accessor: `ticker.prices`.
+
+    ticker_symbol : CharField (max_length=10)
+        Denormalized copy of `Ticker.ticker`, kept in sync by a `pre_save` signal (and rewritten when
+        a ticker is renamed) so that time-series reads can filter by symbol without joining the Ticker table.
 
     date : DateField
         The date for which the trading data is recorded.
 
-    open_price : DecimalField (max_digits=10, decimal_places=2)
+    open_price : FloatField
         The stock's opening price on the specified date.
 
-    high_price : DecimalField (max_digits=10, decimal_places=2)
+    high_price : FloatField
         The highest price reached during the trading day.
 
-    low_price : DecimalField (max_digits=10, decimal_places=2)
+    low_price : FloatField
         The lowest price reached during the trading day.
 
-    close_price : DecimalField (max_digits=10, decimal_places=2)
+    close_price : FloatField
         The closing price of the stock at the end of the trading session.
 
     volume : BigIntegerField
@@ -104,30 +108,31 @@ class EquityPrice(models.Model):
 
     Meta:
     -----
-    - The `unique_together` constraint ensures that each (ticker, date) combination is unique.
-    - An index is created on the `date` field for faster date-based queries.
-    - Another index is created on `(ticker, date)` for efficient searches by ticker and date.
+    - The `unique_together` constraint ensures that each (ticker, date) combination is unique; its index
+      also serves searches by ticker and date.
+    - A covering index on `(ticker_symbol, date)` including `close_price` serves close price time-series
+      reads already sorted, answered from the index alone (`include` is honoured on PostgreSQL only).
 
     Methods:
     --------
     __str__() -> str:
         Returns a human-readable string representation of the equity price record.
     """
-    ticker = models.ForeignKey(Ticker, on_delete=models.CASCADE)  # Relationship to Ticker
+    ticker = models.ForeignKey(Ticker, on_delete=models.CASCADE, related_name="prices")  # Relationship to Ticker
+    ticker_symbol = models.CharField(max_length=10)  # Denormalized Ticker.ticker
     date = models.DateField()  # Trading date
-    open_price = models.DecimalField(max_digits=10, decimal_places=2)
-    high_price = models.DecimalField(max_digits=10, decimal_places=2)
-    low_price = models.DecimalField(max_digits=10, decimal_places=2)
-    close_price = models.DecimalField(max_digits=10, decimal_places=2)
+    open_price = models.FloatField()
+    high_price = models.FloatField()
+    low_price = models.FloatField()
+    close_price = models.FloatField()
     volume = models.BigIntegerField()
 
     class Meta:
-        unique_together = ("ticker", "date")  # Prevents duplicate entries
-        ordering = ["-date"]  # Latest data first
+        unique_together = ("ticker", "date")  # Prevents duplicate entries (and indexes ticker, date)
         indexes = [
-            models.Index(fields=["date"]),  # Optimizes date queries
-            models.Index(fields=["ticker", "date"]),  # Optimizes queries for a ticker on a given date
+            # Covering index so time-series scans of close prices by symbol are served index-only (PostgreSQL)
+            models.Index(fields=["ticker_symbol", "date"], include=["close_price"], name="ep_sym_dt_cp_covering"),
         ]
 
     def __str__(self):
-        return f"{self.ticker.symbol} - {self.date}"
+        return f"{self.ticker.ticker} - {self.date}"
@@ -1,10 +1,83 @@
+import os
+import tempfile
+from pathlib import Path
 import pandas as pd
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, List, Dict, Iterable, Optional, Tuple
+from django.db import connection
 from efficient_frontier.models import EquityPrice, Ticker
-from tool_kit.plots import PlotUsingMatplotLib
+from efficient_frontier.services.time_series_cache import time_series_cache_path, invalidate_time_series_cache
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Row layout used when streaming close prices straight from the database cursor
+RAW_PRICE_DTYPE = np.dtype([("sym", "U10"), ("date", "datetime64[D]"), ("px", "f8")])
+
+# Pandas resampling rule for each supported return frequency
+FREQUENCY_CODES = {"daily": "D", "weekly": "W", "monthly": "M"}
+
+
+@lru_cache(maxsize=None)
+def make_returns_kernel(method: str) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Builds the function computing `method` returns along the first axis of a price array.
+
+    The choice of method is resolved once here, so the returned kernel runs without branching;
+    kernels are cached per method.
+
+    Raises:
+    -------
+    ValueError:
+        If an invalid method is provided.
+    """
+    if method == "simple":
+        def kernel(prices: np.ndarray) -> np.ndarray:
+            returns = prices[1:] / prices[:-1]
+            return np.subtract(returns, 1.0, out=returns)
+    elif method == "log":
+        def kernel(prices: np.ndarray) -> np.ndarray:
+            returns = prices[1:] / prices[:-1]
+            return np.log(returns, out=returns)
+    else:
+        raise ValueError("⚠️ ERROR: Invalid method. Choose 'simple' or 'log'.")
+
+    return kernel
+
+
+def returns_and_stats(prices: np.ndarray, method: str = "log") -> Tuple[np.ndarray, float, float, float, float]:
+    """
+    Computes the returns of a price series together with their mean, standard deviation, min and max.
+
+    The price ratios are computed once into a single buffer, which the returns kernel turns into
+    returns in place, so no intermediate arrays are allocated.
+
+    Parameters:
+    -----------
+    prices : np.ndarray
+        A float64 array of consecutive prices.
+
+    method : str, optional, default="log"
+        - `"simple"`: Simple returns as `(P_t / P_(t-1)) - 1`
+        - `"log"`: Log returns as `log(P_t / P_(t-1))`
+
+    Returns:
+    --------
+    Tuple[np.ndarray, float, float, float, float]
+        The returns and their mean, population standard deviation, minimum and maximum
+        (NaN statistics if fewer than two prices are given).
+
+    Raises:
+    -------
+    ValueError:
+        If an invalid method is provided.
+    """
+    returns = make_returns_kernel(method)(prices)
+    if returns.size == 0:
+        return returns, np.nan, np.nan, np.nan, np.nan
+
+    return returns, float(returns.mean()), float(returns.std()), float(returns.min()), float(returns.max())
+
+
 class StockTimeSeriesProcessor:
     """
     A class to process time series data for multiple tickers from the SQLite database (Django Model).
@@ -24,6 +97,8 @@ class StockTimeSeriesProcessor:
         """
         self.__tickers = tickers  # Private attribute storing tickers
         self.df_dict = {}  # Dictionary to store DataFrames
+        self._wide_prices = None  # Lazily built (date x ticker) close price matrix
+        self._price_arrays = {}  # ticker -> (dates: datetime64[D], close prices: float64)
 
         if tickers:
             self.load_data()
@@ -35,6 +110,9 @@ class StockTimeSeriesProcessor:
         """
         Fetches time series data for all tickers from the database and loads them into Pandas DataFrames.
 
+        Series found in the Parquet cache (`settings.TIME_SERIES_CACHE_DIR`) are read from disk;
+        the remaining tickers are queried from the database and written to the cache.
+
         Raises:
         -------
         ValueError:
@@ -45,17 +123,124 @@ class StockTimeSeriesProcessor:
             return  # Simply exit instead of raising an error
 
         self.df_dict = {}  # Reset data dictionary
+        self._wide_prices = None  # Invalidate the cached price matrix
+        self._price_arrays = {}
+
+        cached, missing = self._read_cache(self.__tickers)
+        for ticker, (dates, prices) in cached.items():
+            self._store_series(ticker, dates, prices)
+
+        if missing:
+            data = self._raw_load(missing)
+
+            # Rows arrive grouped by ticker, so each symbol occupies one contiguous block
+            block_starts = np.flatnonzero(data["sym"][1:] != data["sym"][:-1]) + 1
+            for block in np.split(data, block_starts):
+                if block.size:
+                    ticker = str(block["sym"][0])
+                    dates = np.ascontiguousarray(block["date"])
+                    prices = np.ascontiguousarray(block["px"])
+                    self._store_series(ticker, dates, prices)
+                    self._write_cache(ticker, dates, prices)
 
         for ticker in self.__tickers:
-            ticker_object = Ticker.objects.get(ticker=ticker)
-            time_series = EquityPrice.objects.filter(ticker=ticker_object).values("date", "close_price")
-            df = pd.DataFrame(list(time_series))
+            self.df_dict.setdefault(
+                ticker, pd.DataFrame(columns=["close_price"], index=pd.DatetimeIndex([], name="date"))
+            )
+
+    def _store_series(self, ticker: str, dates: np.ndarray, prices: np.ndarray):
+        """Registers one ticker's close price series in `_price_arrays` and `df_dict`."""
+        self._price_arrays[ticker] = (dates, prices)
+        # Indexed by date once here, so calculations can resample without copying
+        self.df_dict[ticker] = pd.DataFrame(
+            {"close_price": prices},
+            index=pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date"),
+        )
+
+    def _read_cache(self, tickers: List[str]) -> Tuple[Dict[str, Tuple[np.ndarray, np.ndarray]], List[str]]:
+        """
+        Reads close price series from the Parquet cache.
 
-            if not df.empty:
-                df["date"] = pd.to_datetime(df["date"])
-                df = df.sort_values(by="date").reset_index(drop=True)
+        A cached file is used only if it was written after the ticker's `last_updated`
+        timestamp; price writes remove the file through the `EquityPrice` save/delete signals.
+        An unreadable file is removed and its ticker loaded from the database again.
+
+        Returns:
+        --------
+        Tuple[Dict[str, Tuple[np.ndarray, np.ndarray]], List[str]]
+            The (dates, prices) pairs read from the cache and the tickers that must be loaded
+            from the database.
+        """
+        last_updated = dict(Ticker.objects.filter(ticker__in=tickers).values_list("ticker", "last_updated"))
+
+        cached, missing = {}, []
+        for ticker in tickers:
+            path = time_series_cache_path(ticker)
+            updated = last_updated.get(ticker)
+            if updated is not None and path.exists() and path.stat().st_mtime > updated.timestamp():
+                try:
+                    df = pd.read_parquet(path, columns=["date", "close_price"])
+                    cached[ticker] = (df["date"].to_numpy().astype("datetime64[D]"),
+                                      df["close_price"].to_numpy(dtype=np.float64))
+                    continue
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"⚠️ WARNING: Discarding unreadable time series cache for '{ticker}': {e}")
+                    path.unlink(missing_ok=True)
+            missing.append(ticker)
+
+        return cached, missing
+
+    def _write_cache(self, ticker: str, dates: np.ndarray, prices: np.ndarray):
+        """
+        Writes one ticker's close price series to the Parquet cache.
 
-            self.df_dict[ticker] = df
+        The file is written under a temporary name and then renamed into place, so readers never see a
+        partial file, even if the process is killed or another worker writes the same ticker.
+        """
+        path = time_series_cache_path(ticker)
+        temp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, name = tempfile.mkstemp(dir=path.parent, prefix=f".{ticker}.", suffix=".tmp")
+            os.close(fd)
+            temp_path = Path(name)
+            pd.DataFrame({"date": dates, "close_price": prices}).to_parquet(temp_path, compression="zstd",
+                                                                           index=False)
+            os.replace(temp_path, path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ WARNING: Could not write time series cache for '{ticker}': {e}")
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+    def _raw_load(self, tickers: List[str]) -> np.ndarray:
+        """
+        Streams close prices for the given tickers directly from the database cursor.
+
+        Bypasses the ORM so that no model instance or per-row dict is created; row tuples are
+        consumed by `np.fromiter` straight into a single NumPy structured array.
+
+        Parameters:
+        -----------
+        tickers : List[str]
+            Stock ticker symbols to load.
+
+        Returns:
+        --------
+        np.ndarray
+            Structured array with fields ('sym', 'date', 'px'), ordered by ticker and date.
+        """
+        placeholders = ", ".join(["%s"] * len(tickers))
+        # Filters on the denormalized ticker_symbol column, so no join with the Ticker table is needed.
+        # The date is selected as ISO text: NumPy parses it into datetime64[D] in C, skipping the
+        # driver's per-row `datetime.date` construction.
+        sql = (f"SELECT ticker_symbol, CAST(date AS TEXT), close_price "
+               f"FROM {EquityPrice._meta.db_table} "
+               f"WHERE ticker_symbol IN ({placeholders}) "
+               f"ORDER BY ticker_symbol, date")
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, list(tickers))
+            return np.fromiter(cursor, dtype=RAW_PRICE_DTYPE)
 
     # ===========================================
     # REGION: Getter & Setter for Tickers
@@ -82,6 +267,49 @@ class StockTimeSeriesProcessor:
         self.load_data()
         print(f"Tickers updated to {new_tickers}. Data reloaded.")
 
+    # ===========================================
+    # REGION: Data Ingestion
+    # ===========================================
+    @classmethod
+    def ingest(cls, ticker: str, rows: Iterable[Tuple], batch_size: int = 1000) -> int:
+        """
+        Bulk-inserts daily price rows for a ticker, skipping dates that are already stored.
+
+        Uses `bulk_create` (multi-row INSERTs of `batch_size` rows) rather than a `save()` per row.
+        Since this bypasses model signals, `ticker_symbol` is set here and the ticker's cached
+        time series is invalidated explicitly.
+
+        Parameters:
+        -----------
+        ticker : str
+            The stock ticker symbol; the Ticker must already exist.
+
+        rows : Iterable[Tuple]
+            Rows of `(date, open_price, high_price, low_price, close_price, volume)`.
+
+        batch_size : int, optional, default=1000
+            Number of rows per INSERT statement.
+
+        Returns:
+        --------
+        int
+            The number of rows passed to the database.
+
+        Raises:
+        -------
+        Ticker.DoesNotExist:
+            If the ticker is not in the database.
+        """
+        ticker_object = Ticker.objects.only("id", "ticker").get(ticker=ticker)  # Only the key is needed for the FK
+        prices = [
+            EquityPrice(ticker=ticker_object, ticker_symbol=ticker, date=date, open_price=open_price,
+                        high_price=high_price, low_price=low_price, close_price=close_price, volume=volume)
+            for date, open_price, high_price, low_price, close_price, volume in rows
+        ]
+        EquityPrice.objects.bulk_create(prices, batch_size=batch_size, ignore_conflicts=True)
+        invalidate_time_series_cache(ticker)
+        return len(prices)
+
     # ===========================================
     # REGION: Data Processing Methods
     # ===========================================
@@ -97,7 +325,7 @@ class StockTimeSeriesProcessor:
         Returns:
         --------
         pd.DataFrame
-            A DataFrame with columns ['date', 'close_price'].
+            A DataFrame with a 'close_price' column, indexed by 'date'.
         """
         return self.df_dict.get(ticker, pd.DataFrame())
 
@@ -115,8 +343,8 @@ class StockTimeSeriesProcessor:
         float or None
             The most recent close price, or None if no data exists.
         """
-        df = self.df_dict.get(ticker)
-        return df["close_price"].iloc[-1] if df is not None and not df.empty else None
+        arrays = self._price_arrays.get(ticker)
+        return float(arrays[1][-1]) if arrays is not None else None
 
     def get_summary_statistics(self, ticker: str) -> pd.DataFrame:
         """
@@ -132,8 +360,44 @@ class StockTimeSeriesProcessor:
         pd.DataFrame
             A DataFrame containing statistics like mean, median, min, max, and standard deviation.
         """
-        df = self.df_dict.get(ticker)
-        return df["close_price"].describe() if df is not None and not df.empty else pd.DataFrame()
+        arrays = self._price_arrays.get(ticker)
+        if arrays is None:
+            return pd.DataFrame()
+
+        # Same statistics as `Series.describe()`, computed on the cached float64 array
+        prices = arrays[1]
+        q25, q50, q75 = np.percentile(prices, [25, 50, 75])
+        return pd.Series(
+            [prices.size, prices.mean(), prices.std(ddof=1) if prices.size > 1 else np.nan,
+             prices.min(), q25, q50, q75, prices.max()],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            name="close_price",
+        )
+
+    def get_return_statistics(self, ticker: str, method: str = "log") -> pd.Series:
+        """
+        Returns the mean, standard deviation, min and max of a ticker's returns between consecutive observations.
+
+        Parameters:
+        -----------
+        ticker : str
+            The stock ticker symbol.
+
+        method : str, optional, default="log"
+            `"simple"` or `"log"` returns, as in `calculate_returns`.
+
+        Returns:
+        --------
+        pd.Series
+            A Series indexed by ['mean', 'std', 'min', 'max'] (population standard deviation),
+            or an empty Series if no data exists.
+        """
+        arrays = self._price_arrays.get(ticker)
+        if arrays is None:
+            return pd.Series(dtype=np.float64)
+
+        _, mean, std, min_return, max_return = returns_and_stats(arrays[1], method)
+        return pd.Series([mean, std, min_return, max_return], index=["mean", "std", "min", "max"], name="returns")
 
     def plot_time_series(self,
                          nrows: Optional[int] = None,
@@ -174,12 +438,15 @@ class StockTimeSeriesProcessor:
 
         for ticker, df in self.df_dict.items():
             if not df.empty:
-                ts_df_list.append(df[["date", "close_price"]])
+                ts_df_list.append(df.reset_index()[["date", "close_price"]])
                 ts_labels_list.append(ticker)
 
         if not ts_df_list:
             raise ValueError("All loaded tickers have empty data. Cannot plot.")
 
+        # Imported here, so that loading and analysing data does not depend on the plotting helpers
+        from tool_kit.plots import PlotUsingMatplotLib
+
         return PlotUsingMatplotLib.plot(ts_df_list, ts_labels_list, "Date", "Close Price",
                                         nrows=nrows, ncols=ncols, figsize=figsize)
 
@@ -227,54 +494,55 @@ class StockTimeSeriesProcessor:
         if not tickers:
             raise ValueError("⚠️ ERROR: No tickers provided. Use `set_tickers()` to load data first.")
 
-        # Frequency mapping
-        frequency_map = {"daily": "D", "weekly": "W", "monthly": "M"}
-        if frequency not in frequency_map:
+        if frequency not in FREQUENCY_CODES:
             raise ValueError("⚠️ ERROR: Invalid frequency. Choose from 'daily', 'weekly', or 'monthly'.")
 
-        returns_dict = {}  # Dictionary to store results
+        compute_returns = make_returns_kernel(method)
 
+        selected = []
         for ticker in tickers:
             if ticker not in self.df_dict:
                 print(f"⚠️ WARNING: Ticker '{ticker}' not found. Skipping...")
-                continue
-
-            df = self.df_dict[ticker].copy()
-
-            if df.empty:
+            elif self.df_dict[ticker].empty:
                 print(f"⚠️ WARNING: No data available for '{ticker}'. Skipping...")
-                continue
+            else:
+                selected.append(ticker)
 
-            df["close_price"] = df["close_price"].astype(float)
-            # ✅ Fix: Ensure 'date' column is set as index
-            if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])  # Convert to Datetime
-                df.set_index("date", inplace=True)  # Set 'date' as index
+        if not selected:
+            return {}
 
-            if not isinstance(df.index, pd.DatetimeIndex):
-                raise ValueError(f"⚠️ ERROR: Index for '{ticker}' is not a DatetimeIndex. Check data formatting.")
+        # Resample all tickers at once on the shared (date x ticker) matrix
+        resampled = self._get_wide_prices()[selected].resample(FREQUENCY_CODES[frequency]).last().dropna(how="all")
+        observed = resampled.notna().to_numpy()
 
-            # Resample for different frequencies
-            df_resampled = df["close_price"].resample(frequency_map[frequency]).last().dropna()
+        # Forward-filling lets a return bridge a missing observation, as a per-ticker dropna() would
+        prices = resampled.ffill().to_numpy(dtype=np.float64)
 
-            # Convert to NumPy for efficient calculations
-            prices = df_resampled.values
+        # One vectorized operation across every ticker column
+        returns = compute_returns(prices)
 
-            # Calculate returns using NumPy
-            if method == "simple":
-                returns = prices[1:] / prices[:-1] - 1
-            elif method == "log":
-                returns = np.log(prices[1:] / prices[:-1])
-            else:
-                raise ValueError("⚠️ ERROR: Invalid method. Choose 'simple' or 'log'.")
+        # Keep only returns ending on an actual observation and having a previous price
+        keep = observed[1:] & ~np.isnan(returns)
+        return_dates = resampled.index[1:]
 
-            # Convert back to Pandas for reporting
-            returns_df = pd.DataFrame(returns, index=df_resampled.index[1:], columns=["returns"])
+        return {
+            ticker: pd.DataFrame(returns[keep[:, col], col], index=return_dates[keep[:, col]], columns=["returns"])
+            for col, ticker in enumerate(selected)
+        }
 
-            # Store results in dictionary
-            returns_dict[ticker] = returns_df
+    def _get_wide_prices(self) -> pd.DataFrame:
+        """
+        Returns the close prices of all loaded tickers as one (date x ticker) DataFrame.
 
-        return returns_dict
+        The matrix is built once per `load_data()` call and reused by subsequent calculations.
+        Tickers without data are left out.
+        """
+        if self._wide_prices is None:
+            self._wide_prices = pd.concat(
+                {ticker: df["close_price"] for ticker, df in self.df_dict.items() if not df.empty},
+                axis=1,
+            )
+        return self._wide_prices
 
     def export_to_csv(self, ticker: str, file_name: str):
         """
@@ -289,7 +557,7 @@ class StockTimeSeriesProcessor:
         """
         df = self.df_dict.get(ticker)
         if df is not None and not df.empty:
-            df.to_csv(file_name, index=False)
+            df.to_csv(file_name)  # The date index is written as the first column
             print(f"Data for {ticker} exported to {file_name}")
         else:
             print(f"No data found for {ticker}. Cannot export.")
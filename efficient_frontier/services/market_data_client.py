@@ -1,15 +1,60 @@
 import abc
-import yfinance as yf
-import matplotlib.pyplot as plt
-from typing import TypeVar, Iterable, Tuple, Dict, List
-import QuantLib as ql
+import asyncio
+from typing import TYPE_CHECKING, TypeVar, Iterable, Tuple, Dict, List
+import orjson
 import pandas as pd
 from tool_kit.config_loader import CONFIG
-import pandas_datareader.data as web
-from polygon import RESTClient
+from tool_kit.cache import FileCache, cached
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from dateutil.relativedelta import relativedelta
+import threading
 import time
 
-FRED_SERIES_IDS = {
+if TYPE_CHECKING:
+    from polygon import RESTClient
+
+# yfinance, polygon and pyarrow are heavy to import, so they are imported by the methods that use them
+
+# Upper bound on concurrent HTTP requests issued by an extractor
+MAX_FETCH_WORKERS = 20
+
+# Maximum number of symbols Yahoo Finance serves in a single download request
+YAHOO_BATCH_SIZE = 20
+
+# yf.download keeps its results in yfinance module globals that every call resets, so concurrent downloads
+# would mix up each other's results; they are serialized through this lock
+_YF_DOWNLOAD_LOCK = threading.Lock()
+
+# Cache lifetime of responses whose window reaches today (data may still change)
+RECENT_DATA_TTL = 3600
+
+# Polygon.io free tier allowance: requests per rate limit window, and the window in seconds
+POLYGON_REQUESTS_PER_WINDOW = 5
+POLYGON_RATE_LIMIT_WINDOW = 60
+
+# Largest number of base aggregates Polygon.io serves in a single aggregates response
+POLYGON_AGGS_LIMIT = 50000
+
+# Fields kept from the raw Polygon.io aggregates (open, high, low, close, volume, timestamp in ms), as Arrow types
+POLYGON_AGGS_SCHEMA = [("o", "float64"), ("h", "float64"), ("l", "float64"), ("c", "float64"), ("v", "float64"),
+                       ("t", "int64")]
+
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# API keys, read from the configuration once at import (None if a provider is not configured)
+FRED_API_KEY = CONFIG.get("FRED_API_KEY")
+POLYGON_IO_API_KEY = CONFIG.get("POLYGON_IO_API_KEY")
+
+# Treasury constant maturity tenors (FRED_SERIES_IDS aliases) making up the yield curve, shortest first
+YIELD_CURVE_TENORS = ("1M", "3M", "6M", "1Y", "2Y", "5Y", "10Y")
+
+# Read-only: aliases used by callers -> FRED series identifiers
+FRED_SERIES_IDS = MappingProxyType({
     # Treasury Yields
     "10Y": "DGS10",  # 10-Year Treasury Constant Maturity Rate
     "5Y": "DGS5",  # 5-Year Treasury Constant Maturity Rate
@@ -47,7 +92,32 @@ FRED_SERIES_IDS = {
     "SP500": "SP500",  # S&P 500 Index
     "DJIA": "DJIA",  # Dow Jones Industrial Average
     "NASDAQ": "NASDAQCOM",  # NASDAQ Composite Index
-}
+})
+
+
+@lru_cache(maxsize=32)
+def _parse_offset(offset: str) -> relativedelta:
+    """
+    Returns the date shift described by `offset`: 'Xd' moves X days forward, 'Xmo' moves X months back.
+    Callers pass the same few offsets over and over, so parsed values are memoized.
+    """
+    # if we choose days as offset we move forward
+    if offset.endswith("d"):
+        return relativedelta(days=int(offset[:-1]))
+    # if we choose months as offset we move backwards
+    if offset.endswith("mo"):
+        return relativedelta(months=-int(offset[:-2]))
+    raise ValueError("Unsupported offset format. Use 'Xd' for days or 'Xmo' for months.")
+
+
+def window_ttl(end_period) -> float | None:
+    """
+    Returns how long a response for a window ending at `end_period` may be cached:
+    forever (None) once the window lies entirely in the past, `RECENT_DATA_TTL` seconds otherwise.
+    """
+    if end_period and date.fromisoformat(str(end_period)) < date.today():
+        return None
+    return RECENT_DATA_TTL
 
 
 class MarketDataExtractor(abc.ABC):
@@ -111,6 +181,11 @@ class MarketDataExtractor(abc.ABC):
     ```
     """
 
+    __slots__ = ("_data_provider", "_tickers", "_start_period", "_end_period", "extracted_data", "_cache")
+
+    _session = None
+    _session_lock = threading.Lock()
+
     def __init__(self, data_provider: str,
                  tickers: List[str] | str | None = None,
                  start_period: str = None,
@@ -132,26 +207,53 @@ class MarketDataExtractor(abc.ABC):
         end_period : str, optional, default=None
             The end date for data retrieval (YYYY-MM-DD format).
         """
-        self.__data_provider = data_provider
-        self.__tickers = tickers or []
-        self.__start_period = start_period
-        self.__end_period = end_period
+        self._data_provider = data_provider
+        self._tickers = self._normalize_tickers(tickers)
+        self._start_period = start_period
+        self._end_period = end_period
         self.extracted_data = None
+        self._cache = FileCache(namespace=data_provider)  # On-disk cache of fetched responses
+
+    @staticmethod
+    def _normalize_tickers(tickers: List[str] | str | None) -> Tuple[str, ...]:
+        """Returns the tickers as a tuple, so that a single symbol and a list of symbols are handled alike."""
+        if not tickers:
+            return ()
+        if isinstance(tickers, str):
+            return (tickers,)
+        return tuple(tickers)
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Returns the HTTP session shared by all extractors of this class, creating it on first use.
+
+        Connections are kept alive and reused, and the pool holds enough of them for `MAX_FETCH_WORKERS`
+        concurrent requests (a default session keeps 10 and discards the rest after each request).
+        """
+        with cls._session_lock:
+            # Looked up in the class' own namespace, so that each provider gets its own session
+            session = cls.__dict__.get("_session")
+            if session is None:
+                session = requests.Session()
+                session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_FETCH_WORKERS))
+                cls._session = session
+        return session
 
     # ===========================================
     # REGION: Setters
     # ===========================================
     def set_data_provider(self, data_provider):
-        self.__data_provider = data_provider
+        self._data_provider = data_provider
 
     def set_tickers(self, tickers):
-        self.__tickers = tickers
+        self._tickers = self._normalize_tickers(tickers)
 
     def set_start_period(self, start_period):
-        self.__start_period = start_period
+        self._start_period = start_period
 
     def set_end_period(self, end_date):
-        self.__end_period = end_date
+        self._end_period = end_date
 
     def set_data(self, data: dict | pd.DataFrame):
         self.extracted_data = data
@@ -165,19 +267,19 @@ class MarketDataExtractor(abc.ABC):
     # ===========================================
     @property
     def get_data_provider(self):
-        return self.__data_provider
+        return self._data_provider
 
     @property
     def get_tickers(self):
-        return self.__tickers
+        return self._tickers
 
     @property
     def get_start_period(self):
-        return self.__start_period
+        return self._start_period
 
     @property
     def get_end_period(self):
-        return self.__end_period
+        return self._end_period
 
     # ===========================================
     # END REGION: Getters
@@ -189,13 +291,15 @@ class MarketDataExtractor(abc.ABC):
 
 
 class YahooFinanceExtractor(MarketDataExtractor):
+    __slots__ = ()
+
     def __init__(self, start_date, end_date, tickers):
-        super().__init__("YahooFinance", start_date, end_date, tickers)
+        super().__init__("YahooFinance", tickers=tickers, start_period=start_date, end_period=end_date)
 
     def fetch_data(self,
                    column_name="Close",
-                   offset='1d') -> Dict[str, pd.DataFrame | List]:
-        # TODO refactor this method!
+                   offset='1d',
+                   max_workers: int = MAX_FETCH_WORKERS) -> Dict[str, pd.DataFrame | List]:
         """
         Extracts historical market data from Yahoo Finance.
 
@@ -211,6 +315,13 @@ class YahooFinanceExtractor(MarketDataExtractor):
         column_name : str, optional, default="Close"
             The column name to extract from Yahoo Finance data.
 
+        offset : str, optional, default='1d'
+            Window searched for the first price when no end period is set: 'Xd' looks X days forward,
+            'Xmo' looks X months back.
+
+        max_workers : int, optional, default=MAX_FETCH_WORKERS
+            Upper bound on concurrent requests sent to Yahoo Finance.
+
         Returns:
         --------
         dict :
@@ -223,57 +334,227 @@ class YahooFinanceExtractor(MarketDataExtractor):
         NotImplementedError:
             If an unsupported extraction case is encountered.
         """
-        if isinstance(self.get_tickers, str):
-            tickers = [self.get_tickers]
-        else:
-            tickers = self.get_tickers
+        tickers, start_period, end_period = self.get_tickers, self.get_start_period, self.get_end_period
 
-        underlier_prices_dict = {}
+        # The request shape is the same for every ticker, so it is decided once and each case gets its own loop
+        if start_period and end_period and start_period != end_period:
+            return self._fetch_range(tickers, column_name, (start_period, end_period), max_workers) if tickers else {}
 
-        # Fetching data for each ticker
-        for ticker in tickers:
-            if self.get_start_period and self.get_end_period and self.get_start_period != self.get_end_period:
-                df = yf.Ticker(ticker).history(start=self.get_start_period, end=self.get_end_period)[[column_name]]
-                underlier_prices_dict[ticker] = df
+        if start_period and (end_period is None or start_period == end_period):
+            # Determine the actual end period only if None
+            if end_period is None:
+                computed_end_period = (date.fromisoformat(start_period) + _parse_offset(offset)).isoformat()
+            else:
+                computed_end_period = end_period
+
+            if offset.endswith("d"):
+                window = (start_period, computed_end_period)
+            else:
+                window = (computed_end_period, start_period)
+            return self._fetch_single(tickers, column_name, window, max_workers) if tickers else {}
 
-            elif self.get_start_period and (
-                    self.get_end_period is None or self.get_start_period == self.get_end_period):
-                # Determine the actual end period only if None using QuantLib
-                if self.get_end_period is None:
-                    ql_start_date = ql.DateParser.parseISO(self.get_start_period)
-                    # if we choose days as offset we move one day forward
-                    if offset.endswith("d"):
-                        days_back = int(offset[:-1])
-                        ql_end_date = ql_start_date + ql.Period(days_back, ql.Days)
-                    # if we choose months as offset we move backwards
-                    elif offset.endswith("mo"):
-                        months_back = int(offset[:-2])
-                        ql_end_date = ql_start_date - ql.Period(months_back, ql.Months)
-                    else:
-                        raise ValueError("Unsupported offset format. Use 'Xd' for days or 'Xmo' for months.")
-
-                    computed_end_period = ql_end_date.ISO()
-                else:
-                    computed_end_period = self.get_end_period
-                if offset.endswith("d"):
-                    df = yf.Ticker(ticker).history(start=self.get_start_period, end=computed_end_period)
-                else:
-                    df = yf.Ticker(ticker).history(start=computed_end_period, end=self.get_start_period)
+        raise NotImplementedError("Unsupported extraction case.")
 
-                if not df.empty:
-                    underlier_prices_dict[ticker] = [df.index[0].date(), df.iloc[0][column_name]]
-                else:
-                    underlier_prices_dict[ticker] = None  # Handle case where data isn't available
+    def _fetch_single(self, tickers: List[str], column_name: str, window: Tuple[str, str],
+                      max_workers: int = MAX_FETCH_WORKERS) -> Dict[str, List | None]:
+        """
+        Fetches `[date, price]` of the first available row within `window` = (start, end) for every ticker.
+
+        Requests are I/O bound, so tickers are fetched concurrently; a ticker that fails is reported and
+        mapped to None.
+        """
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+            futures = {ticker: executor.submit(self._fetch_one, ticker, column_name, window) for ticker in tickers}
+
+            # Results keep the ticker order
+            underlier_prices_dict = dict.fromkeys(tickers)
+            for ticker, future in futures.items():
+                # A failing ticker is reported and left empty, so that it doesn't discard the rest of the batch
+                try:
+                    underlier_prices_dict[ticker] = future.result()
+                except Exception as e:
+                    print(f"⚠️ WARNING: Could not fetch '{ticker}' from Yahoo Finance: {e}")
+
+        return underlier_prices_dict
+
+    def _fetch_range(self, tickers: List[str], column_name: str, window: Tuple[str, str],
+                     max_workers: int = MAX_FETCH_WORKERS) -> Dict[str, pd.DataFrame]:
+        """
+        Downloads the `column_name` history of many tickers over `window` = (start, end).
+
+        Tickers found in the file cache are not requested again. The others are fetched with
+        `yf.download`, which returns up to `YAHOO_BATCH_SIZE` symbols per HTTP request, instead
+        of one `history()` request per ticker. Tickers Yahoo Finance returns nothing for map to None.
+        """
+        import yfinance as yf
+
+        start, end = window
+        keys = {ticker: FileCache.make_key(self.get_data_provider, ticker, column_name, start, end)
+                for ticker in tickers}
+
+        # Keys are laid out in ticker order up front, so the result needs no reordering once filled
+        underlier_prices_dict = dict.fromkeys(tickers)
+        missing = []
+        for ticker in tickers:
+            cached = self._cache.get(keys[ticker])
+            if cached is None:
+                missing.append(ticker)
             else:
-                raise NotImplementedError("Unsupported extraction case.")
+                underlier_prices_dict[ticker] = cached
+
+        for i in range(0, len(missing), YAHOO_BATCH_SIZE):
+            batch = missing[i:i + YAHOO_BATCH_SIZE]
+            # auto_adjust=True keeps the adjusted prices `Ticker.history()` returns by default
+            with _YF_DOWNLOAD_LOCK:
+                panel = yf.download(tickers=batch, start=start, end=end, group_by="ticker",
+                                    auto_adjust=True, threads=min(max_workers, len(batch)), progress=False,
+                                    session=self._get_session())
+            for ticker in batch:
+                # yf.download returns the symbols upper-cased; a ticker missing from the panel is reported and
+                # left empty, so that it doesn't discard the rest of the batch
+                try:
+                    df = panel[ticker.upper()][[column_name]]
+                except KeyError as e:
+                    print(f"⚠️ WARNING: Could not fetch '{ticker}' from Yahoo Finance: {e}")
+                    continue
+                # Drop dates on which only the other tickers in the batch traded
+                df = df.dropna(how="all")
+                underlier_prices_dict[ticker] = df
+                if not df.empty:
+                    self._cache.set(keys[ticker], df, ttl=window_ttl(end))
 
         return underlier_prices_dict
 
+    def _fetch_one(self, ticker: str, column_name: str, window: Tuple[str, str]) -> List | None:
+        """
+        Fetches `[date, price]` of the first available row of a single ticker within `window` = (start, end),
+        or None if there is none.
+        """
+        import yfinance as yf
+
+        start, end = window
+        key = FileCache.make_key(self.get_data_provider, "first_row", ticker, column_name, start, end)
+        df = self._cache.get(key)
+        if df is None:
+            # actions=False skips building the Dividends/Stock Splits columns; prices stay adjusted
+            history = yf.Ticker(ticker, session=self._get_session()).history(start=start, end=end, actions=False)
+            df = history.iloc[:1][[column_name]]
+            if not df.empty:
+                self._cache.set(key, df, ttl=window_ttl(end))
+
+        if not df.empty:
+            return [df.index[0].date(), df[column_name].iat[0]]
+        return None  # Handle case where data isn't available
+
 
 class FREDExtractor(MarketDataExtractor):
+    __slots__ = ("_api_key",)
+
     def __init__(self, start_date, end_date, tickers):
-        super().__init__("FRED", start_date, end_date, tickers)
-        self.__api_key = CONFIG.FRED_API_KEY
+        super().__init__("FRED", tickers=tickers, start_period=start_date, end_period=end_date)
+        self._api_key = FRED_API_KEY
+
+    @classmethod
+    @cached("FRED", ttl=lambda cls, series_id, start_period, end_period, api_key: window_ttl(end_period))
+    def _get_observations(cls, series_id: str, start_period: str, end_period: str, api_key: str) -> pd.DataFrame:
+        """
+        Requests the observations of a single FRED series straight from the FRED REST API, using `api_key`.
+        Responses are kept in the file cache, unless they hold no published value yet.
+
+        Returns:
+        --------
+        pd.DataFrame :
+            One column named after `series_id`, indexed by observation date. Missing values ('.') are NaN.
+        """
+        response = cls._get_session().get(FRED_OBSERVATIONS_URL, params={
+            "series_id": series_id,
+            "observation_start": start_period,
+            "observation_end": end_period,
+            "api_key": api_key,
+            "file_type": "json",
+        }, timeout=10)
+        response.raise_for_status()
+        observations = orjson.loads(response.content)["observations"]
+        return pd.DataFrame(
+            {series_id: pd.to_numeric([obs["value"] for obs in observations], errors="coerce")},
+            index=pd.DatetimeIndex([obs["date"] for obs in observations], name="DATE"),
+        )
+
+    @classmethod
+    def fetch_many(cls, series_ids: Iterable[str], start_period: str, end_period: str) -> Dict[str, pd.DataFrame]:
+        """
+        Fetches several FRED series over the same window concurrently, over one shared session.
+
+        Parameters:
+        -----------
+        series_ids : Iterable[str]
+            FRED series identifiers (e.g. "DGS10"), not the `FRED_SERIES_IDS` aliases.
+
+        start_period : str
+            The start date for data retrieval (YYYY-MM-DD format).
+
+        end_period : str
+            The end date for data retrieval (YYYY-MM-DD format).
+
+        Returns:
+        --------
+        dict :
+            A dictionary where keys are series identifiers and values are DataFrames as returned by FRED.
+        """
+        series_ids = list(series_ids)
+        if not series_ids:
+            return {}
+        api_key = FRED_API_KEY
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(series_ids))) as executor:
+            frames = executor.map(lambda series_id: cls._get_observations(series_id, start_period, end_period, api_key),
+                                  series_ids)
+            return dict(zip(series_ids, frames))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _get_single_value(cls, series_id: str, observation_date: str, api_key: str) -> float:
+        """
+        Returns the value of `series_id` on `observation_date`, as a fraction (percent / 100).
+
+        Published FRED observations do not change, so values are memoized for the lifetime of the process
+        on top of the on-disk cache. Failed requests, and dates with no published value (yet), raise and are
+        therefore not memoized.
+        """
+        data = cls._get_observations(series_id, observation_date, observation_date, api_key)
+        if data.empty or pd.isna(data.iat[0, 0]):
+            raise ValueError(f"No observation of {series_id} published for {observation_date}.")
+        return float(data.iat[0, 0]) / 100
+
+    @classmethod
+    def fetch_curve(cls, observation_date: str, tenors: Iterable[str] = YIELD_CURVE_TENORS) -> Dict[str, float]:
+        """
+        Fetches the rates of several tenors on one date, e.g. to build a yield curve.
+
+        FRED serves one series per request, so the tenors are requested concurrently. Each value goes through
+        the same memoized lookup as single-date `fetch_data` calls.
+
+        Parameters:
+        -----------
+        observation_date : str
+            The date of the rates (YYYY-MM-DD format).
+
+        tenors : Iterable[str], optional, default=YIELD_CURVE_TENORS
+            `FRED_SERIES_IDS` aliases of the rates to fetch (e.g. "3M", "10Y").
+
+        Returns:
+        --------
+        dict :
+            A dictionary where keys are the tenors and values are the rates as fractions (percent / 100).
+        """
+        tenors = list(tenors)
+        if not tenors:
+            return {}
+        api_key = FRED_API_KEY
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(tenors))) as executor:
+            rates = executor.map(
+                lambda tenor: cls._get_single_value(FRED_SERIES_IDS[tenor], observation_date, api_key), tenors
+            )
+            return dict(zip(tenors, rates))
 
     def fetch_data(self) -> float | pd.DataFrame:
         """
@@ -289,25 +570,86 @@ class FREDExtractor(MarketDataExtractor):
 
         Raises:
         -------
+        KeyError:
+            If the instrument is not one of the `FRED_SERIES_IDS` aliases.
+
+        NotImplementedError:
+            If the start and end periods differ (only single-date queries are supported so far).
+
         RuntimeError:
             If data retrieval fails due to incorrect API configuration or network issues.
         """
 
+        start_period = self.get_start_period
+        if start_period != self.get_end_period:
+            raise NotImplementedError("Another cases are not implemented yet")
+
+        series_id = FRED_SERIES_IDS[self.get_tickers[0]]
         try:
-            if self.get_start_period == self.get_end_period:
-
-                # Fetch data from FRED
-                data = web.DataReader(FRED_SERIES_IDS[self.get_tickers],
-                                      "fred", self.get_start_period,
-                                      self.get_end_period,
-                                      api_key=CONFIG['FRED_API_KEY'])
-                return data.values[0][0] / 100
-            else:
-                NotImplementedError("Another cases are not implemented yet")
+            return self._get_single_value(series_id, start_period, self._api_key)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch data: {e}")
 
 
+class _PolygonRateLimiter:
+    """
+    Token bucket allowing `tokens` requests per `refill_interval` seconds, shared by all threads.
+
+    A spent token comes back `refill_interval` seconds after it was taken, so no window of that length sees more
+    than `tokens` requests, and callers only wait for as long as the oldest request still counts against the limit.
+    """
+
+    def __init__(self, tokens: int, refill_interval: float):
+        self.__tokens = tokens
+        self.__refill_interval = refill_interval
+        self.__spent = deque()  # monotonic times of the requests still counting against the limit
+        self.__lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Blocks until a request may be sent, then takes a token for it.
+        Returns the `time.monotonic()` time at which the token was taken.
+        """
+        with self.__lock:
+            while True:
+                now = time.monotonic()
+                while self.__spent and now - self.__spent[0] >= self.__refill_interval:
+                    self.__spent.popleft()
+                if len(self.__spent) < self.__tokens:
+                    self.__spent.append(now)
+                    return now
+                wait = self.__refill_interval - (now - self.__spent[0])
+                print(f"Polygon.io rate limit reached ({self.__tokens} requests). Waiting {wait:.0f} seconds...")
+                time.sleep(wait)
+
+
+# Process-wide limiter of the Polygon.io API key's request allowance. Every Polygon.io request takes a token first:
+# company details, aggregates and FX closes, from the extractor as well as from `tool_kit.database_api`
+polygon_rate_limiter = _PolygonRateLimiter(POLYGON_REQUESTS_PER_WINDOW, POLYGON_RATE_LIMIT_WINDOW)
+
+_polygon_client = None
+_polygon_client_lock = threading.Lock()
+
+
+def polygon_client() -> "RESTClient":
+    """
+    Returns the Polygon.io client shared by the whole process, creating it on first use.
+
+    Reusing one client keeps its urllib3 connection pool, so requests after the first skip the
+    TCP/TLS handshake.
+    """
+    global _polygon_client
+    with _polygon_client_lock:
+        if _polygon_client is None:
+            from polygon import RESTClient
+
+            client = RESTClient(POLYGON_IO_API_KEY, connect_timeout=10, read_timeout=30)
+            # Keep enough sockets per host for concurrent requests to reuse connections
+            client.client.connection_pool_kw["maxsize"] = MAX_FETCH_WORKERS
+            _polygon_client = client
+    return _polygon_client
+
+
 class PolygonIoExtractor(MarketDataExtractor):
     """
     Description
@@ -328,13 +670,8 @@ class PolygonIoExtractor(MarketDataExtractor):
     tickers : str or List[str]
         A single stock ticker or a list of tickers to extract historical data.
 
-    Attributes:
-    -----------
-    __api_key : str
-        The API key used for authenticating requests to Polygon.io.
-
-    __client : polygon.RESTClient
-        The client instance for interacting with the Polygon.io API.
+    Requests go through the process-wide `polygon_client()` and take a token from `polygon_rate_limiter` first,
+    so HTTP connections are pooled across extractors and the API key's allowance is never exceeded.
 
     Methods:
     --------
@@ -359,10 +696,10 @@ class PolygonIoExtractor(MarketDataExtractor):
     ```
     """
 
+    __slots__ = ()
+
     def __init__(self, start_date, end_date, tickers):
-        super().__init__("PolygonIO", start_date, end_date, tickers)
-        self.__api_key = CONFIG["POLYGON_IO_API_KEY"]
-        self.__client = RESTClient(self.__api_key)
+        super().__init__("PolygonIO", tickers=tickers, start_period=start_date, end_period=end_date)
 
     def get_company_details(self, ticker: str) -> dict:
         """
@@ -382,10 +719,10 @@ class PolygonIoExtractor(MarketDataExtractor):
             raise ValueError("No tickers specified for Polygon.io extractor.")
 
         company_info = {}
-        request_count = 0
         for ticker in self.get_tickers:
             try:
-                response = self.__client.get_ticker_details(ticker)
+                polygon_rate_limiter.acquire()
+                response = polygon_client().get_ticker_details(ticker)
                 if not response:
                     print(f"No company info found for {ticker}.")
                     continue
@@ -409,45 +746,62 @@ class PolygonIoExtractor(MarketDataExtractor):
                     "logo_url": response.branding.logo_url,
                     "icon_url": response.branding.icon_url
                 }
-                request_count += 1
-                print(f"Rate limit reached ({request_count}/5 requests). Sleeping for 60 seconds...")
-                time.sleep(65)  # Wait for 60 seconds before making more requestsif request_count > 5:
-                request_count = 0  # Reset request count after sleep
 
             except Exception as e:
                 print(f"Error fetching company info for {ticker} from Polygon.io: {e}")
-                # **Retry on rate limit error**
-                if "rate limit" in str(e).lower():
-                    print("Rate limit hit! Sleeping for 60 seconds before retrying...")
-                    time.sleep(65)  # Wait 1 minute before retrying
-                    continue  # Retry the same ticker
         return company_info
 
-    def fetch_data(self):
-        """Fetch historical stock data from Polygon.io."""
-        if not self.get_tickers:
+    def fetch_data(self) -> Dict[str, pd.DataFrame]:
+        """Fetch historical stock data from Polygon.io and return it keyed by ticker."""
+        tickers = self.get_tickers
+        if not tickers:
             raise ValueError("No tickers specified for Polygon.io extractor.")
 
-        all_data = dict()
-        for ticker in self.get_tickers:
-            aggs = self.__client.get_aggs(
-                ticker=ticker, multiplier=1, timespan="day",
-                from_=self.get_start_period, to=self.get_end_period
-            )
-            df = pd.DataFrame(aggs)
-            df["date"] = pd.to_datetime(df["timestamp"], unit="ms").dt.date
-            df.set_index("date", inplace=True)
-            df["ticker"] = ticker
-            all_data[ticker] = df
+        # Requests are I/O bound, so tickers are fetched concurrently (results keep the ticker order);
+        # requests beyond the API key's allowance wait for the shared rate limiter, cache hits do not
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(tickers))) as executor:
+            all_data = dict(zip(tickers, executor.map(self._fetch_aggs, tickers)))
 
-        for ticker in all_data.keys():
-            if all_data[ticker].empty:
+        start_period, end_period = self.get_start_period, self.get_end_period
+        for ticker, df in all_data.items():
+            if df.empty:
                 print(f"No data available for {ticker}")
             else:
-                print(f"For {ticker} and for time window {self.get_start_period} to {self.get_end_period}"
-                      f" {len(all_data[ticker])} has been extracted.")
+                print(f"For {ticker} and for time window {start_period} to {end_period}"
+                      f" {len(df)} has been extracted.")
 
         print(f"Fetching data from Polygon.io has been completed!!")
+        self.set_data(all_data)
+        return all_data
+
+    def _fetch_aggs(self, ticker: str) -> pd.DataFrame:
+        """
+        Returns the daily aggregates of a single ticker over the extractor's window, indexed by date.
+        """
+        start_period, end_period = self.get_start_period, self.get_end_period
+        key = FileCache.make_key(self.get_data_provider, "ohlcv-daily", ticker, start_period, end_period)
+        df = self._cache.get(key)
+        if df is None:
+            import pyarrow as pa
+
+            # get_aggs does not paginate, so the limit is raised to return long windows whole in one request.
+            # The raw JSON rows go straight into an Arrow table, instead of being deserialized into Agg objects
+            polygon_rate_limiter.acquire()
+            response = polygon_client().get_aggs(
+                ticker=ticker, multiplier=1, timespan="day",
+                from_=start_period, to=end_period, limit=POLYGON_AGGS_LIMIT, raw=True
+            )
+            rows = orjson.loads(response.data).get("results", [])
+            table = pa.Table.from_pylist(rows, schema=pa.schema(POLYGON_AGGS_SCHEMA))
+
+            df = table.drop_columns("t").rename_columns(["open", "high", "low", "close", "volume"]).to_pandas()
+            # Epoch milliseconds are reinterpreted as datetimes in place, then truncated to the trading day
+            timestamps = table.column("t").to_numpy()
+            df.index = pd.DatetimeIndex(timestamps.view("datetime64[ms]"), name="date").normalize()
+            df["ticker"] = ticker
+            if not df.empty:
+                self._cache.set(key, df, ttl=window_ttl(end_period))
+        return df
 
     def get_fx_close_price(self, fx_pair, date):
         """
@@ -472,10 +826,10 @@ class PolygonIoExtractor(MarketDataExtractor):
         Exception
             For unexpected API errors or connection issues.
         """
-        client = RESTClient(CONFIG["POLYGON_IO_API_KEY"])
         try:
             # Fetch aggregate data for the given forex pair and date
-            aggs = client.get_aggs(
+            polygon_rate_limiter.acquire()
+            aggs = polygon_client().get_aggs(
                 ticker=fx_pair,
                 multiplier=1,
                 timespan="day",
@@ -514,8 +868,16 @@ class DataProviderFactory:
     get_extractor(provider: str, start_date: str | None, end_date: str | None = None, tickers: List[str] | str | None = None) -> MarketDataExtractor
     Creates and returns an instance of a MarketDataExtractor subclass based on the specified provider."""
 
-    @staticmethod
-    def get_extractor(provider: str,
+    # Read-only: provider name -> extractor class, built once instead of on every get_extractor call
+    _EXTRACTORS = MappingProxyType({
+        "YahooFinance": YahooFinanceExtractor,
+        "FRED": FREDExtractor,
+        "PolygonIO": PolygonIoExtractor
+    })
+
+    @classmethod
+    def get_extractor(cls,
+                      provider: str,
                       start_date: str | None = None,
                       end_date: str | None = None,
                       tickers: List[str] | str | None = None) -> YahooFinanceExtractor|FREDExtractor|PolygonIoExtractor:
@@ -566,13 +928,38 @@ class DataProviderFactory:
 
     """
 
-        extractors = {
-            "YahooFinance": YahooFinanceExtractor,
-            "FRED": FREDExtractor,
-            "PolygonIO": PolygonIoExtractor
-        }
+        if provider not in cls._EXTRACTORS:
+            raise ValueError(f"Invalid provider: {provider}. Choose from {list(cls._EXTRACTORS.keys())}")
 
-        if provider not in extractors:
-            raise ValueError(f"Invalid provider: {provider}. Choose from {list(extractors.keys())}")
+        return cls._EXTRACTORS[provider](start_date, end_date, tickers)
 
-        return extractors[provider](start_date, end_date, tickers)
+    @classmethod
+    async def gather_all(cls, specs: Iterable[Tuple[str, str | None, str | None, List[str] | str | None]]) -> List:
+        """
+        Description:
+        -----------
+        Fetches data from several providers at the same time.
+
+        The extractors are synchronous, so each `fetch_data` call runs in the event loop's default thread pool
+        and the network latency of the providers overlaps instead of adding up.
+
+        Parameters:
+        -----------
+        specs : Iterable[Tuple[str, str | None, str | None, List[str] | str | None]]
+            One `(provider, start_date, end_date, tickers)` tuple per extractor, as taken by `get_extractor`.
+
+        Returns:
+        --------
+        list
+            The result of each extractor's `fetch_data`, in the order of `specs`.
+
+        Examples:
+        ---------
+        >>> specs = [("YahooFinance", "2025-02-18", "2025-03-12", ["AAPL", "MSFT"]),
+        ...          ("FRED", "2025-03-12", "2025-03-12", "10Y")]
+        >>> prices, risk_free_rate = asyncio.run(DataProviderFactory.gather_all(specs))
+        """
+        extractors = [cls.get_extractor(*spec) for spec in specs]
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*(loop.run_in_executor(None, extractor.fetch_data)
+                                           for extractor in extractors)))
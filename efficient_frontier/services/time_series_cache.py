@@ -0,0 +1,12 @@
+from pathlib import Path
+from django.conf import settings
+
+
+def time_series_cache_path(ticker: str) -> Path:
+    """Returns the Parquet file caching the close price series of `ticker`."""
+    return Path(settings.TIME_SERIES_CACHE_DIR) / f"{ticker}.parquet"
+
+
+def invalidate_time_series_cache(ticker: str):
+    """Removes the cached close price series of `ticker` so the next load reads the database."""
+    time_series_cache_path(ticker).unlink(missing_ok=True)
@@ -0,0 +1,51 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from efficient_frontier.models import EquityPrice, Ticker
+from efficient_frontier.services.time_series_cache import invalidate_time_series_cache
+
+
+@receiver(pre_save, sender=EquityPrice)
+def sync_ticker_symbol(sender, instance, **kwargs):
+    """
+    Copies the related ticker symbol onto the denormalized `EquityPrice.ticker_symbol` column.
+
+    Note:
+    -----
+    `bulk_create` and `QuerySet.update` bypass signals, so callers using them must set
+    `ticker_symbol` explicitly.
+    """
+    instance.ticker_symbol = instance.ticker.ticker
+
+
+@receiver(post_save, sender=EquityPrice)
+@receiver(post_delete, sender=EquityPrice)
+def invalidate_cached_time_series(sender, instance, **kwargs):
+    """
+    Drops the cached close price series of the ticker whose prices changed.
+
+    Note:
+    -----
+    As with `sync_ticker_symbol`, bulk operations must call `invalidate_time_series_cache` themselves.
+    """
+    invalidate_time_series_cache(instance.ticker_symbol)
+
+
+@receiver(post_save, sender=Ticker)
+def propagate_ticker_rename(sender, instance, created, **kwargs):
+    """
+    Rewrites `EquityPrice.ticker_symbol` on the prices of a ticker whose symbol changed.
+
+    Time-series reads filter on the denormalized symbol alone, so without this a renamed ticker's history
+    would no longer be found. The cached series under both the old and the new symbol are dropped.
+    """
+    if created:
+        return
+
+    stale = EquityPrice.objects.filter(ticker=instance).exclude(ticker_symbol=instance.ticker)
+    old_symbols = set(stale.values_list("ticker_symbol", flat=True).distinct())
+    if not old_symbols:
+        return
+
+    stale.update(ticker_symbol=instance.ticker)
+    for symbol in old_symbols | {instance.ticker}:
+        invalidate_time_series_cache(symbol)
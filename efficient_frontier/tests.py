@@ -1,3 +1,398 @@
-from django.test import TestCase
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import pandas as pd
+from django.db import IntegrityError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from efficient_frontier.models import Ticker, EquityPrice
+from efficient_frontier.services.data_processing_client import StockTimeSeriesProcessor, FREQUENCY_CODES
+from efficient_frontier.services.time_series_cache import time_series_cache_path
+from tool_kit import database_api
+from tool_kit.cache import FileCache, cached
+from efficient_frontier.services.market_data_client import _PolygonRateLimiter, FREDExtractor, YahooFinanceExtractor
+
+
+def reference_returns(close_prices: pd.Series, method: str, frequency: str) -> pd.DataFrame:
+    """Per-ticker returns as computed before `calculate_returns` was vectorized across tickers."""
+    resampled = close_prices.resample(FREQUENCY_CODES[frequency]).last().dropna()
+    prices = resampled.to_numpy(dtype=np.float64)
+    ratios = prices[1:] / prices[:-1]
+    returns = np.log(ratios) if method == "log" else ratios - 1
+    return pd.DataFrame(returns, index=resampled.index[1:], columns=["returns"])
+
+
+class InMemoryFileCacheMixin:
+    """Replaces the on-disk `FileCache` with a dictionary for the duration of each test."""
+
+    def setUp(self):
+        super().setUp()
+        self.file_cache = {}
+        fakes = {
+            "get": lambda cache, key: self.file_cache.get(key),
+            "set": lambda cache, key, df, ttl=None: self.file_cache.__setitem__(key, df),
+        }
+        for name, fake in fakes.items():
+            patcher = mock.patch.object(FileCache, name, autospec=True, side_effect=fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class PolygonClientMixin:
+    """Serves `database_api`'s Polygon.io requests from `self.client` instead of the network, without rate limit."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = mock.Mock()
+        for name, value in (("polygon_client", lambda: self.client), ("polygon_rate_limiter", mock.Mock())):
+            patcher = mock.patch.object(database_api, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+def company_details(name="Apple Inc."):
+    """Polygon.io ticker details response carrying the fields stored on `Ticker`."""
+    return SimpleNamespace(name=name, description="Consumer electronics", market="stocks", sic_code="3571",
+                           sic_description="Electronic computers", currency_name="usd",
+                           address=SimpleNamespace(address1="One Apple Park Way", city="Cupertino"))
+
+
+class CalculateReturnsTest(TestCase):
+    """
+    Checks the vectorized `calculate_returns` against the per-ticker computation, on tickers with
+    gaps in their history and staggered start dates.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = np.random.default_rng(7)
+        business_days = pd.bdate_range("2024-01-01", "2024-06-28")
+        cls.histories = {
+            # Full history with a few scattered missing days
+            "AAA": business_days.delete([5, 6, 40, 41, 42, 90]),
+            # Starts a month and a half later, with a missing week
+            "BBB": business_days[32:].delete(range(20, 25)),
+            # Starts in March and stops trading in mid-May
+            "CCC": business_days[45:95],
+        }
+        for symbol, dates in cls.histories.items():
+            ticker = Ticker.objects.create(ticker=symbol)
+            close_prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+            EquityPrice.objects.bulk_create([
+                EquityPrice(ticker=ticker, ticker_symbol=symbol, date=day.date(), open_price=price,
+                            high_price=price, low_price=price, close_price=price, volume=1000)
+                for day, price in zip(dates, close_prices)
+            ])
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings_override = override_settings(TIME_SERIES_CACHE_DIR=cache_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.processor = StockTimeSeriesProcessor(list(self.histories))
+
+    def test_matches_per_ticker_returns(self):
+        for method in ("simple", "log"):
+            for frequency in FREQUENCY_CODES:
+                with self.subTest(method=method, frequency=frequency):
+                    returns = self.processor.calculate_returns(method=method, frequency=frequency)
+                    self.assertEqual(list(returns), list(self.histories))
+                    for symbol, df in returns.items():
+                        expected = reference_returns(self.processor.get_data(symbol)["close_price"],
+                                                     method, frequency)
+                        pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+    def test_subset_of_tickers(self):
+        returns = self.processor.calculate_returns(["CCC", "UNKNOWN"], method="log", frequency="weekly")
+        self.assertEqual(list(returns), ["CCC"])
+        pd.testing.assert_frame_equal(
+            returns["CCC"],
+            reference_returns(self.processor.get_data("CCC")["close_price"], "log", "weekly"),
+            check_freq=False,
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.processor.calculate_returns(method="arithmetic")
+        with self.assertRaises(ValueError):
+            self.processor.calculate_returns(frequency="yearly")
+
+
+class TimeSeriesCacheTest(TestCase):
+    """Checks that `load_data` serves series from the Parquet cache and recovers from unreadable cache files."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ticker = Ticker.objects.create(ticker="AAA")
+        EquityPrice.objects.bulk_create([
+            EquityPrice(ticker=ticker, ticker_symbol="AAA", date=day.date(), open_price=price, high_price=price,
+                        low_price=price, close_price=price, volume=1000)
+            for day, price in zip(pd.bdate_range("2024-01-01", periods=30), np.linspace(100, 130, 30))
+        ])
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_dir = Path(cache_dir.name)
+        settings_override = override_settings(TIME_SERIES_CACHE_DIR=cache_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # The first load reads the database and writes the cache
+        self.expected = StockTimeSeriesProcessor(["AAA"]).get_data("AAA")
+
+    def test_cache_is_written_atomically(self):
+        self.assertTrue(time_series_cache_path("AAA").exists())
+        self.assertEqual(list(self.cache_dir.glob("*.tmp")), [])
+
+    def test_cache_hit_skips_the_database(self):
+        with mock.patch.object(StockTimeSeriesProcessor, "_raw_load",
+                               side_effect=AssertionError("database read")) as raw_load:
+            processor = StockTimeSeriesProcessor(["AAA"])
+        raw_load.assert_not_called()
+        pd.testing.assert_frame_equal(processor.get_data("AAA"), self.expected)
+
+    def test_corrupt_cache_file_is_reloaded_from_the_database(self):
+        path = time_series_cache_path("AAA")
+        path.write_bytes(path.read_bytes()[:len(path.read_bytes()) // 2])  # Truncated, as by a killed writer
+
+        processor = StockTimeSeriesProcessor(["AAA"])
+        pd.testing.assert_frame_equal(processor.get_data("AAA"), self.expected)
+
+        # The damaged file was replaced, so the next load is a cache hit again
+        with mock.patch.object(StockTimeSeriesProcessor, "_raw_load") as raw_load:
+            processor = StockTimeSeriesProcessor(["AAA"])
+        raw_load.assert_not_called()
+        pd.testing.assert_frame_equal(processor.get_data("AAA"), self.expected)
+
+
+    def test_renamed_ticker_keeps_its_history(self):
+        ticker = Ticker.objects.get(ticker="AAA")
+        ticker.ticker = "AAB"
+        ticker.save()
+
+        self.assertFalse(time_series_cache_path("AAA").exists())
+        self.assertFalse(EquityPrice.objects.filter(ticker_symbol="AAA").exists())
+        processor = StockTimeSeriesProcessor(["AAB"])
+        pd.testing.assert_frame_equal(processor.get_data("AAB"), self.expected)
+
+
+class CompanyInfoBatchTest(InMemoryFileCacheMixin, PolygonClientMixin, TestCase):
+    """Checks the single upsert of `fetch_and_store_company_info_batch`."""
+
+    def test_incomplete_rows_do_not_discard_the_batch(self):
+        self.client.get_ticker_details.side_effect = lambda symbol: company_details(None if symbol == "BAD" else symbol)
+
+        companies = database_api.fetch_and_store_company_info_batch(["AAPL", "BAD", "MSFT"])
+
+        self.assertEqual([company.ticker for company in companies], ["AAPL", "MSFT"])
+        self.assertEqual(dict(Ticker.objects.values_list("ticker", "name")), {"AAPL": "AAPL", "MSFT": "MSFT"})
+
+    def test_updates_refresh_last_updated(self):
+        Ticker.objects.create(ticker="AAPL", name="Old name")
+        stale = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        Ticker.objects.filter(ticker="AAPL").update(last_updated=stale)
+        self.client.get_ticker_details.return_value = company_details()
+
+        database_api.fetch_and_store_company_info_batch(["AAPL"])
+
+        ticker = Ticker.objects.get(ticker="AAPL")
+        self.assertEqual(ticker.name, "Apple Inc.")
+        self.assertGreater(ticker.last_updated, stale)
+
+    def test_failed_upsert_returns_no_companies(self):
+        self.client.get_ticker_details.return_value = company_details()
+
+        with mock.patch.object(Ticker.objects, "bulk_create", side_effect=IntegrityError("rejected")):
+            companies = database_api.fetch_and_store_company_info_batch(["AAPL"])
+
+        self.assertEqual(companies, [])
+
+
+class PolygonRateLimiterTest(SimpleTestCase):
+    """Checks that `_PolygonRateLimiter` never lets more than `tokens` requests through per refill interval."""
+
+    TOKENS = 3
+    REFILL_INTERVAL = 0.2
+
+    def test_allowance_is_not_delayed(self):
+        limiter = _PolygonRateLimiter(self.TOKENS, self.REFILL_INTERVAL)
+        start = time.monotonic()
+        for _ in range(self.TOKENS):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - start, self.REFILL_INTERVAL / 2)
+
+    def test_waits_for_the_oldest_token(self):
+        limiter = _PolygonRateLimiter(self.TOKENS, self.REFILL_INTERVAL)
+        start = time.monotonic()
+        for _ in range(self.TOKENS + 1):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, self.REFILL_INTERVAL)
+
+    def test_concurrent_requests_stay_within_the_limit(self):
+        limiter = _PolygonRateLimiter(self.TOKENS, self.REFILL_INTERVAL)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sent = sorted(executor.map(lambda _: limiter.acquire(), range(3 * self.TOKENS)))
+
+        # Any TOKENS + 1 consecutive tokens must have been taken at least one refill interval apart
+        for first, last in zip(sent, sent[self.TOKENS:]):
+            self.assertGreaterEqual(last - first, self.REFILL_INTERVAL)
+
+
+class CachedDecoratorTest(InMemoryFileCacheMixin, SimpleTestCase):
+    """Checks which results the `cached` decorator keeps."""
+
+    def cached_fetch(self, result: pd.DataFrame):
+        calls = []
+
+        @cached("Test")
+        def fetch(key):
+            calls.append(key)
+            return result
+
+        return fetch, calls
+
+    def test_complete_result_is_cached(self):
+        fetch, calls = self.cached_fetch(pd.DataFrame({"value": [1.0, np.nan]}))
+        fetch("a")
+        fetch("a")
+        self.assertEqual(calls, ["a"])
+
+    def test_empty_and_missing_results_are_retried(self):
+        for result in (pd.DataFrame(), pd.DataFrame({"value": [np.nan, np.nan]})):
+            with self.subTest(result=result):
+                fetch, calls = self.cached_fetch(result)
+                fetch("a")
+                fetch("a")
+                self.assertEqual(calls, ["a", "a"])
+                self.assertEqual(self.file_cache, {})
+
+
+class FREDSingleValueTest(InMemoryFileCacheMixin, SimpleTestCase):
+    """Checks that single-date FRED values are only cached once FRED has published them."""
+
+    def setUp(self):
+        super().setUp()
+        FREDExtractor._get_single_value.cache_clear()
+        self.addCleanup(FREDExtractor._get_single_value.cache_clear)
+        self.session = mock.Mock()
+        patcher = mock.patch.object(FREDExtractor, "_get_session", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def respond(self, *values):
+        """Makes the successive FRED requests return one observation each, with the given values."""
+        self.session.get.side_effect = [
+            mock.Mock(content=f'{{"observations": [{{"date": "2020-01-02", "value": "{value}"}}]}}'.encode())
+            for value in values
+        ]
+
+    def fetch(self) -> float:
+        return FREDExtractor("2020-01-02", "2020-01-02", ["10Y"]).fetch_data()
+
+    def test_unpublished_value_is_retried(self):
+        self.respond(".", "1.5")
+
+        with self.assertRaises(RuntimeError):
+            self.fetch()
+        self.assertEqual(self.file_cache, {})
+
+        self.assertAlmostEqual(self.fetch(), 0.015)
+        self.assertEqual(self.session.get.call_count, 2)
+
+    def test_empty_response_is_retried(self):
+        self.session.get.side_effect = [mock.Mock(content=b'{"observations": []}')]
+
+        with self.assertRaises(RuntimeError):
+            self.fetch()
+        self.assertEqual(self.file_cache, {})
+
+    def test_published_value_is_cached(self):
+        self.respond("1.5")
+        self.assertAlmostEqual(self.fetch(), 0.015)
+
+        # Served from the file cache after a restart (the in-process memo is cleared)
+        FREDExtractor._get_single_value.cache_clear()
+        self.assertAlmostEqual(self.fetch(), 0.015)
+        self.assertEqual(self.session.get.call_count, 1)
+
+
+class EquityPricesStoreTest(InMemoryFileCacheMixin, PolygonClientMixin, TestCase):
+    """Checks how `fetch_and_store_equity_prices` stores Polygon.io daily bars."""
+
+    def setUp(self):
+        super().setUp()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings_override = override_settings(TIME_SERIES_CACHE_DIR=cache_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @staticmethod
+    def bar(day: str, volume):
+        timestamp = int(pd.Timestamp(day, tz="UTC").timestamp() * 1000)
+        return SimpleNamespace(open=1.0, high=2.0, low=0.5, close=1.5, volume=volume, timestamp=timestamp)
+
+    def test_fractional_and_missing_volumes(self):
+        self.client.list_aggs.return_value = iter([
+            self.bar("2024-01-02", 2.7),
+            self.bar("2024-01-03", None),
+            self.bar("2024-01-04", 1_000_000.4),
+        ])
+
+        database_api.fetch_and_store_equity_prices(["AAPL"], "2024-01-02", "2024-01-05")
+
+        stored = EquityPrice.objects.filter(ticker_symbol="AAPL").order_by("date").values_list("date", "volume")
+        self.assertEqual([(day.isoformat(), volume) for day, volume in stored],
+                         [("2024-01-02", 3), ("2024-01-04", 1_000_000)])
+
+
+class YahooRangeDownloadTest(InMemoryFileCacheMixin, SimpleTestCase):
+    """Checks how `YahooFinanceExtractor` reads the panels returned by `yf.download`."""
+
+    def setUp(self):
+        super().setUp()
+        self.active_downloads, self.max_active_downloads = 0, 0
+        self.counter_lock = threading.Lock()
+        patcher = mock.patch.dict(sys.modules, {"yfinance": SimpleNamespace(download=self.download)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def download(self, tickers, start, end, **kwargs):
+        """Mimics `yf.download`: symbols come back upper-cased, and unknown ones ('GONE') are left out."""
+        with self.counter_lock:
+            self.active_downloads += 1
+            self.max_active_downloads = max(self.max_active_downloads, self.active_downloads)
+        time.sleep(0.05)
+        with self.counter_lock:
+            self.active_downloads -= 1
+
+        symbols = sorted({ticker.upper() for ticker in tickers} - {"GONE"})
+        columns = pd.MultiIndex.from_product([symbols, ["Open", "Close"]])
+        return pd.DataFrame(1.0, index=pd.date_range(start, periods=3, name="Date"), columns=columns)
+
+    def test_lowercase_and_missing_symbols(self):
+        prices = YahooFinanceExtractor("2024-01-02", "2024-02-01", ["aapl", "GONE", "MSFT"]).fetch_data()
+
+        self.assertEqual(list(prices), ["aapl", "GONE", "MSFT"])
+        self.assertIsNone(prices["GONE"])
+        for ticker in ("aapl", "MSFT"):
+            self.assertEqual(list(prices[ticker].columns), ["Close"])
+            self.assertEqual(len(prices[ticker]), 3)
+
+    def test_concurrent_downloads_are_serialized(self):
+        extractors = [YahooFinanceExtractor("2024-01-02", "2024-02-01", [ticker]) for ticker in ("A", "B", "C")]
+        with ThreadPoolExecutor(max_workers=len(extractors)) as executor:
+            results = list(executor.map(lambda extractor: extractor.fetch_data(), extractors))
+
+        self.assertEqual([list(result) for result in results], [["A"], ["B"], ["C"]])
+        self.assertEqual(self.max_active_downloads, 1)
@@ -0,0 +1,128 @@
+import functools
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Callable
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path.home() / ".alpha-wolf" / "cache"
+
+
+class FileCache:
+    """
+    On-disk cache of DataFrames, stored as Parquet files.
+
+    Each entry is written to `<cache_dir>/<namespace>/<key>.parquet` together with a JSON sidecar
+    recording when it was written and how long it stays valid.
+
+    Parameters:
+    -----------
+    namespace : str, optional, default=""
+        Sub-directory grouping related entries (e.g. the data provider name).
+
+    cache_dir : str or Path, optional, default=~/.alpha-wolf/cache
+        Root directory of the cache.
+
+    Usage:
+    ------
+    ```python
+    cache = FileCache("PolygonIO")
+    key = FileCache.make_key("PolygonIO", "AAPL", "2025-01-01", "2025-02-01")
+    df = cache.get(key)
+    if df is None:
+        df = fetch()
+        cache.set(key, df, ttl=None)
+    ```
+    """
+
+    def __init__(self, namespace: str = "", cache_dir: str | Path = DEFAULT_CACHE_DIR):
+        self.__directory = Path(cache_dir) / namespace
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Returns a stable file-name-safe key for the given request parameters."""
+        return hashlib.md5(repr(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """
+        Returns the cached DataFrame for `key`, or None if it is missing or expired.
+        """
+        data_path, meta_path = self.__paths(key)
+        try:
+            with open(meta_path, "r") as file:
+                metadata = json.load(file)
+            if metadata["ttl"] is not None and time.time() - metadata["created"] > metadata["ttl"]:
+                return None
+            return pd.read_parquet(data_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, df: pd.DataFrame, ttl: float | None = None):
+        """
+        Stores `df` under `key`.
+
+        Parameters:
+        -----------
+        key : str
+            Key produced by `make_key`.
+
+        df : pd.DataFrame
+            The data to cache.
+
+        ttl : float or None, optional, default=None
+            Seconds the entry stays valid; None keeps it forever.
+        """
+        data_path, meta_path = self.__paths(key)
+        try:
+            self.__directory.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(data_path)
+            with open(meta_path, "w") as file:
+                json.dump({"created": time.time(), "ttl": ttl}, file)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ WARNING: Could not write cache entry {key}: {e}")
+
+    def __paths(self, key: str) -> tuple[Path, Path]:
+        return self.__directory / f"{key}.parquet", self.__directory / f"{key}.json"
+
+
+def cached(namespace: str, ttl: float | None | Callable[..., float | None] = None):
+    """
+    Decorator caching the DataFrame returned by a function in a `FileCache`, keyed by the call's arguments.
+
+    Empty results, and results holding only missing values, are not cached, so a request that found nothing is
+    retried on the next call.
+
+    Parameters:
+    -----------
+    namespace : str
+        Sub-directory of the cache the entries are written to (e.g. the data provider name).
+
+    ttl : float, None or callable, optional, default=None
+        Seconds an entry stays valid (None keeps it forever), or a function receiving the same arguments as the
+        decorated function and returning that value, for TTLs that depend on the request.
+
+    Usage:
+    ------
+    ```python
+    @cached("PolygonIO", ttl=lambda ticker, start, end: window_ttl(end))
+    def fetch_aggs(ticker, start, end) -> pd.DataFrame:
+        ...
+    ```
+    """
+    def decorator(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        cache = FileCache(namespace)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> pd.DataFrame:
+            key = FileCache.make_key(func.__qualname__, args, sorted(kwargs.items()))
+            df = cache.get(key)
+            if df is None:
+                df = func(*args, **kwargs)
+                if df is not None and not df.empty and not df.isna().all(axis=None):
+                    cache.set(key, df, ttl=ttl(*args, **kwargs) if callable(ttl) else ttl)
+            return df
+
+        return wrapper
+
+    return decorator
@@ -1,12 +1,76 @@
-from polygon import RESTClient
 from efficient_frontier.models import Ticker, EquityPrice
+from efficient_frontier.services.market_data_client import (polygon_client, polygon_rate_limiter, POLYGON_AGGS_LIMIT,
+                                                             POLYGON_REQUESTS_PER_WINDOW, window_ttl)
+from efficient_frontier.services.time_series_cache import invalidate_time_series_cache
 from django.db import IntegrityError
-from tool_kit.config_loader import CONFIG
+from tool_kit.cache import cached
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import time
 
+# Company details rarely change, so they are cached for 30 days
+COMPANY_INFO_TTL = 30 * 24 * 3600
+
+# Number of price rows written per INSERT statement
+PRICE_BATCH_SIZE = 1000
+
+# Ticker fields filled from the Polygon.io company details
+COMPANY_FIELDS = ["name", "description", "market", "sic_code", "sic_description", "address", "city", "currency_name"]
+
+# Company fields the Ticker table does not accept as NULL
+REQUIRED_COMPANY_FIELDS = [field for field in COMPANY_FIELDS if not Ticker._meta.get_field(field).null]
+
+
+@cached("PolygonIO", ttl=COMPANY_INFO_TTL)
+def _fetch_company_data(ticker_symbol: str) -> pd.DataFrame:
+    """Requests the company details of `ticker_symbol` from Polygon.io, as a one-row DataFrame (empty if none)."""
+    polygon_rate_limiter.acquire()
+    response = polygon_client().get_ticker_details(ticker_symbol)
+    if not response:
+        return pd.DataFrame()
+
+    # Extract relevant fields
+    return pd.DataFrame([{
+        "name": response.name,
+        "description": response.description,
+        "market": response.market,
+        "sic_code": response.sic_code,
+        "sic_description": response.sic_description,
+        "address": response.address.address1,
+        "city": response.address.city,
+        "currency_name": response.currency_name
+    }])
+
+
+@cached("PolygonIO", ttl=lambda ticker_symbol, start_date, end_date: window_ttl(end_date))
+def _fetch_daily_aggs(ticker_symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Requests the daily aggregates of `ticker_symbol` from Polygon.io, with epoch-ms timestamps (empty if none)."""
+    polygon_rate_limiter.acquire()
+    # list_aggs follows the pagination links, so long windows are not cut off at the first page;
+    # at the maximum page size a daily window needs a single request
+    aggs = list(polygon_client().list_aggs(
+        ticker=ticker_symbol,
+        multiplier=1,
+        timespan="day",
+        from_=start_date,
+        to=end_date,
+        limit=POLYGON_AGGS_LIMIT
+    ))
+    if not aggs:
+        return pd.DataFrame()
+
+    # Built column by column: one typed array per field, instead of pandas unpacking every Agg object into a row.
+    # Volumes stay float64 like the prices: Polygon.io may report them fractional, and missing fields become NaN
+    n = len(aggs)
+    return pd.DataFrame({
+        "open": np.fromiter((agg.open for agg in aggs), dtype=np.float64, count=n),
+        "high": np.fromiter((agg.high for agg in aggs), dtype=np.float64, count=n),
+        "low": np.fromiter((agg.low for agg in aggs), dtype=np.float64, count=n),
+        "close": np.fromiter((agg.close for agg in aggs), dtype=np.float64, count=n),
+        "volume": np.fromiter((agg.volume for agg in aggs), dtype=np.float64, count=n),
+        "timestamp": np.fromiter((agg.timestamp for agg in aggs), dtype=np.int64, count=n),
+    })
 
-# Set your Polygon API Key
 
 def fetch_and_store_company_info(ticker_symbol):
     """
@@ -22,27 +86,14 @@ def fetch_and_store_company_info(ticker_symbol):
     CompanyInfo instance or None
         The updated or created CompanyInfo object, or None if the request fails.
     """
-    client = RESTClient(CONFIG["POLYGON_IO_API_KEY"])
-    request_count = 0
-
     try:
-        response = client.get_ticker_details(ticker_symbol)
+        details = _fetch_company_data(ticker_symbol)
 
-        if not response:
+        if details.empty:
             print(f"No data found for {ticker_symbol}.")
             return None
 
-        # Extract relevant fields
-        company_data = {
-            "name": response.name,
-            "description": response.description,
-            "market": response.market,
-            "sic_code": response.sic_code,
-            "sic_description": response.sic_description,
-            "address": response.address.address1,
-            "city": response.address.city,
-            "currency_name": response.currency_name
-        }
+        company_data = details.iloc[0].to_dict()
 
         try:
             # Update or create company information in the database
@@ -55,21 +106,75 @@ def fetch_and_store_company_info(ticker_symbol):
             return company_obj
         except IntegrityError as e:
             print(f"Database error while storing company info for {ticker_symbol}: {e}")
-            # **RATE LIMIT HANDLING: Sleep after every 5 requests**
-        request_count += 1
-        if request_count >= 5:
-            print(f"Reached 5 API calls. Sleeping for 70 seconds...")
-            time.sleep(70)  # Respect API rate limit
-            request_count = 0  # Reset counter after sleep
     except Exception as e:
         print(f"Error fetching company info for {ticker_symbol} from Polygon.io: {e}")
         return None
 
 
+def fetch_and_store_company_info_batch(ticker_symbols, max_workers=POLYGON_REQUESTS_PER_WINDOW):
+    """
+    Fetch company information for many tickers concurrently and store it with a single upsert.
+
+    Requests share one Polygon.io client and the module's rate limit, so the threads never exceed the API
+    allowance; details already in the file cache are not requested again.
+
+    Parameters:
+    -----------
+    ticker_symbols : list[str]
+        List of stock ticker symbols (e.g., ["AAPL", "MSFT"]).
+    max_workers : int, optional, default=POLYGON_REQUESTS_PER_WINDOW
+        Number of concurrent requests.
+
+    Returns:
+    --------
+    list[Ticker]
+        The created or updated Ticker objects, for the tickers whose details were found and complete
+        (empty if the upsert failed).
+    """
+    def fetch(ticker_symbol):
+        try:
+            return _fetch_company_data(ticker_symbol)
+        except Exception as e:
+            print(f"Error fetching company info for {ticker_symbol} from Polygon.io: {e}")
+            return pd.DataFrame()
+
+    ticker_symbols = list(ticker_symbols)
+    if not ticker_symbols:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(ticker_symbols))) as executor:
+        details = dict(zip(ticker_symbols, executor.map(fetch, ticker_symbols)))
+
+    companies = []
+    for ticker_symbol, company_data in details.items():
+        if company_data.empty:
+            print(f"No data found for {ticker_symbol}.")
+            continue
+
+        company = company_data.iloc[0].to_dict()
+        # A row breaking a NOT NULL constraint would make the database reject the whole upsert
+        incomplete = [field for field in REQUIRED_COMPANY_FIELDS if pd.isna(company.get(field))]
+        if incomplete:
+            print(f"⚠️ WARNING: Skipping company info for {ticker_symbol}, missing {', '.join(incomplete)}.")
+            continue
+        companies.append(Ticker(ticker=ticker_symbol, **company))
+
+    try:
+        # last_updated (auto_now) is refreshed on updated rows too, as update_or_create does
+        Ticker.objects.bulk_create(companies, update_conflicts=True, unique_fields=["ticker"],
+                                   update_fields=COMPANY_FIELDS + ["last_updated"])
+    except IntegrityError as e:
+        print(f"Database error while storing company info: {e}")
+        return []
+
+    print(f"Stored company info for {len(companies)} of {len(ticker_symbols)} tickers.")
+    return companies
+
+
 def fetch_and_store_equity_prices(ticker_symbols, start_date, end_date):
     """
     Fetch and store historical equity prices from Polygon.io.
-    Implements rate limit handling (5 requests per minute).
+    Implements rate limit handling (5 requests per minute); windows already in the file cache are not requested again.
 
     Parameters:
     -----------
@@ -84,55 +189,61 @@ def fetch_and_store_equity_prices(ticker_symbols, start_date, end_date):
     --------
     None
     """
-    client = RESTClient(CONFIG["POLYGON_IO_API_KEY"])
-    request_count = 0  # Track API request count
+    # Ensure all tickers exist in the DB: one SELECT ... IN and one INSERT for the missing ones, instead of one
+    # get_or_create per ticker. Only the primary keys are loaded, as the foreign key needs nothing else
+    ticker_symbols = list(ticker_symbols)
+    ticker_ids = dict(Ticker.objects.filter(ticker__in=ticker_symbols).values_list("ticker", "id"))
+    missing = [Ticker(ticker=ticker_symbol) for ticker_symbol in dict.fromkeys(ticker_symbols)
+               if ticker_symbol not in ticker_ids]
+    if missing:
+        Ticker.objects.bulk_create(missing, ignore_conflicts=True)
+        ticker_ids = dict(Ticker.objects.filter(ticker__in=ticker_symbols).values_list("ticker", "id"))
 
     for index, ticker_symbol in enumerate(ticker_symbols, start=1):
         try:
-            # Ensure the ticker exists in the DB
-            ticker_obj, created = Ticker.objects.get_or_create(ticker=ticker_symbol)
+            ticker_id = ticker_ids[ticker_symbol]
 
             # Fetch historical data
-            aggs = client.get_aggs(
-                ticker=ticker_symbol,
-                multiplier=1,
-                timespan="day",
-                from_=start_date,
-                to=end_date
-            )
+            df = _fetch_daily_aggs(ticker_symbol, start_date, end_date)
 
-            if not aggs:
+            if df.empty:
                 print(f"No data found for {ticker_symbol}.")
                 continue
 
-            df = pd.DataFrame(aggs)
-            df["date"] = pd.to_datetime(df["timestamp"], unit="ms").dt.date  # Convert timestamp to date only
-
-            # Store data in the database
-            for _, row in df.iterrows():
-                try:
-                    EquityPrice.objects.update_or_create(
-                        ticker=ticker_obj,
-                        date=row['date'],  # Ensure correct date format
-                        defaults={
-                            "open_price": row["open"],
-                            "high_price": row["high"],
-                            "low_price": row["low"],
-                            "close_price": row["close"],
-                            "volume": row["volume"],
-                        },
-                    )
-                except IntegrityError as e:
-                    print(f"Database error while storing equity prices for {ticker_symbol}: {e}")
+            # A bar missing any field cannot be stored; it is skipped instead of failing the whole window
+            complete = df[["open", "high", "low", "close", "volume"]].notna().all(axis=1)
+            if not complete.all():
+                print(f"⚠️ WARNING: Skipping {(~complete).sum()} incomplete bars of {ticker_symbol}.")
+                df = df[complete]
+
+            # Volumes are stored as whole shares: fractional ones are rounded rather than truncated
+            volumes = df["volume"].to_numpy().round().astype(np.int64)
+
+            # Convert timestamps to dates once for the whole column, then read every field from its numpy array
+            dates = pd.to_datetime(df["timestamp"], unit="ms", cache=True).dt.date.to_numpy()
+
+            # Store data in the database: one upsert per batch of rows instead of a SELECT + INSERT/UPDATE per row.
+            # bulk_create bypasses model signals, so ticker_symbol is set here and the cached series invalidated below
+            prices = [
+                EquityPrice(ticker_id=ticker_id, ticker_symbol=ticker_symbol, date=date, open_price=open_price,
+                            high_price=high_price, low_price=low_price, close_price=close_price, volume=volume)
+                for date, open_price, high_price, low_price, close_price, volume
+                in zip(dates, df["open"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy(),
+                       df["close"].to_numpy(), volumes)
+            ]
+            try:
+                EquityPrice.objects.bulk_create(
+                    prices,
+                    batch_size=PRICE_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=["ticker", "date"],
+                    update_fields=["open_price", "high_price", "low_price", "close_price", "volume"],
+                )
+            except IntegrityError as e:
+                print(f"Database error while storing equity prices for {ticker_symbol}: {e}")
+            invalidate_time_series_cache(ticker_symbol)
 
             print(f"Equity price data for {ticker_symbol} saved successfully!")
 
-            # **Rate Limit Handling: Sleep after every 5 requests**
-            request_count += 1
-            if request_count >= 5:
-                print(f"Reached 5 API calls. Sleeping for 70 seconds...")
-                time.sleep(70)  # Respect API rate limit
-                request_count = 0  # Reset counter after sleep
-
         except Exception as e:
             print(f"Error fetching equity prices for {ticker_symbol} from Polygon.io: {e}")